@@ -96,6 +96,10 @@ export default Vue.component('panel-messages-received', function(resolve, reject
                       'top_user_receiving_spam'
                     ].forEach(item => {
                         this[item] = response.data[item];
+                        BvTable.arraysToObjects(
+                            this[item].items,
+                            this[item].fields
+                        );
                         BvTable.setFieldDefinitions(
                             this[item].fields,
                             this[item].field_types
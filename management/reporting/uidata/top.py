@@ -1,3 +1,5 @@
+from operator import itemgetter
+
 def select_top(c, select, start, end, y, fields, field_types):
     '''`c` is a cursor
 
@@ -21,12 +23,26 @@ substitutes 'start_date' and 'end_date'.
         'field_types': field_types,
         'items': []
     }
-    for row in c.execute(select, {
-            'start_date':start,
-            'end_date':end
-    }):
-        v = {}
-        for key in fields:
-            v[key] = row[key]            
-        top['items'].append(v)
+    c.arraysize = 1000
+    c.execute(select, {
+        'start_date':start,
+        'end_date':end
+    })
+
+    # items are sent as arrays ordered by `fields` (see
+    # BvTable.arraysToObjects in ui/charting.js), not objects. the
+    # select's column order need not match `fields`, so resolve each
+    # field's column index once instead of looking up every field by
+    # name on every row
+    columns = [ d[0] for d in c.description ]
+    getter = itemgetter(*[ columns.index(key) for key in fields ])
+    items = top['items']
+    while True:
+        batch = c.fetchmany()
+        if not batch:
+            break
+        if len(fields) == 1:
+            items.extend([ getter(row) ] for row in batch)
+        else:
+            items.extend(list(getter(row)) for row in batch)
     return top